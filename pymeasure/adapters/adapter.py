@@ -213,7 +213,9 @@ class Adapter:
         binary = self.read()
         # header = binary[:header_bytes]
         data = binary[header_bytes:]
-        return np.fromstring(data, dtype=dtype)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return np.frombuffer(data, dtype=dtype)
 
     # Binary format methods
     def read_binary_values(self, header_bytes=0, termination_bytes=None,
@@ -223,13 +225,16 @@ class Adapter:
         :param int header_bytes: Number of bytes to ignore in header.
         :param int termination_bytes: Number of bytes to strip at end of message or None.
         :param dtype: The NumPy data type to format the values with.
-        :param \\**kwargs: Further arguments for the NumPy fromstring method.
+        :param \\**kwargs: Further arguments for the NumPy frombuffer method.
         :returns: NumPy array of values
         """
         binary = self.read_bytes(-1)
         # header = binary[:header_bytes]
         data = binary[header_bytes:termination_bytes]
-        return np.fromstring(data, dtype=dtype, **kwargs)
+        if kwargs.get("sep", ""):
+            # Text-based transfer, e.g. values separated by spaces
+            return np.fromstring(data, dtype=dtype, **kwargs)
+        return np.frombuffer(data, dtype=dtype, **kwargs)
 
     def _format_binary_values(self, values, datatype='f', is_big_endian=False, header_fmt="ieee"):
         """Format values in binary format, used internally in :meth:`Adapter.write_binary_values`.
@@ -244,7 +244,7 @@ class VISAAdapter(Adapter):
         binary = self.connection.read_raw()
         # header = binary[:header_bytes]
         data = binary[header_bytes:]
-        return np.fromstring(data, dtype=dtype)
+        return np.frombuffer(data, dtype=dtype)
 
     def wait_for_srq(self, timeout=25, delay=0.1):
         """ Block until a SRQ, and leave the bit high
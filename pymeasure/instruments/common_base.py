@@ -542,6 +542,19 @@ class CommonBase:
         else:
             warn("Do not use `command_process`, use a dynamic property instead.", FutureWarning)
 
+        # A static (non-dynamic) property keeps its definition parameters forever, so
+        # the inverse of a value map can be computed once here instead of scanning
+        # `values.items()` on every get. Dynamic properties may be reconfigured at
+        # runtime and keep the generic scan.
+        inverse_values = None
+        if not dynamic and map_values and isinstance(values, dict):
+            try:
+                inverse_values = {v: k for k, v in values.items()}
+                if len(inverse_values) != len(values):
+                    inverse_values = None  # ambiguous map, scan to keep the first match
+            except TypeError:
+                inverse_values = None  # unhashable mapped values
+
         def fget(self,
                  get_command=get_command,
                  values=values,
@@ -549,6 +562,7 @@ class CommonBase:
                  get_process=get_process,
                  command_process=command_process,
                  check_get_errors=check_get_errors,
+                 inverse_values=inverse_values,
                  ):
             if get_command is None:
                 raise LookupError("Property can not be read.")
@@ -576,6 +590,13 @@ class CommonBase:
                 elif isinstance(values, (list, tuple, range)):
                     return values[int(value)]
                 elif isinstance(values, dict):
+                    if inverse_values is not None:
+                        try:
+                            return inverse_values[value]
+                        except KeyError:
+                            raise KeyError(f"Value {value} not found in mapped values") from None
+                        except TypeError:
+                            pass  # the processed value is unhashable, scan instead
                     for k, v in values.items():
                         if v == value:
                             return k
@@ -21,17 +21,30 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import asyncio
 import logging
 import re
+from functools import partial
+
+import numpy as np
 
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.teledyne.teledyne_oscilloscope import TeledyneOscilloscope,\
-    TeledyneOscilloscopeChannel, sanitize_source
+    TeledyneOscilloscopeChannel, sanitize_source, _results_list_to_dict
 from pymeasure.instruments.validators import strict_discrete_set, strict_range
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+# Pattern of a math waveform definition, e.g. "'C1+C2'", compiled once at module
+# load instead of on every acquisition_sample_size("MATH") call.
+_MATH_DEFINE_RE = re.compile(r"'(\w+)[+\-/*](\w+)'")
+
+# Pattern of a reply that consists only of comma-separated numbers.
+_NUMERIC_CSV_RE = re.compile(
+    r"^\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+    r"(?:\s*,\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)*\s*$")
+
 
 def _math_define_validator(value, values):
     """
@@ -161,6 +174,36 @@ class LeCroyT3DSO1204(TeledyneOscilloscope):
 
     _BOOLS = {True: "ON", False: "OFF"}
 
+    _ACQUISITION_TYPES = {"normal": "SAMPLING", "peak": "PEAK_DETECT", "average": "AVERAGE",
+                          "highres": "HIGH_RES"}
+
+    _ACQUISITION_STATES = {"stopped": "Stop", "triggered": "Trig'd", "ready": "Ready",
+                           "auto": "Auto", "armed": "Arm"}
+
+    _MEMORY_SIZES = {7e3: "7K", 7e4: "70K", 7e5: "700K", 7e6: "7M",
+                     14e3: "14K", 14e4: "140K", 14e5: "1.4M", 14e6: "14M"}
+
+    # Inverse maps, precomputed once so that parsing a preamble does not rescan the
+    # forward maps for every field of every frame.
+    _ACQUISITION_TYPES_INV = {v: k for k, v in _ACQUISITION_TYPES.items()}
+
+    _ACQUISITION_STATES_INV = {v: k for k, v in _ACQUISITION_STATES.items()}
+
+    _MEMORY_SIZES_INV = {v: k for k, v in _MEMORY_SIZES.items()}
+
+    # Dispatch table of acquisition_sample_size, keyed by both the integer and the
+    # string form of each source. Channels 1/2 and 3/4 share an ADC and therefore
+    # the sample size, so each pair aliases to a single property and duplicate
+    # SANU? queries can be detected and skipped.
+    _ACQUISITION_SAMPLE_SIZES = {1: "acquisition_sample_size_c1",
+                                 "C1": "acquisition_sample_size_c1",
+                                 2: "acquisition_sample_size_c1",
+                                 "C2": "acquisition_sample_size_c1",
+                                 3: "acquisition_sample_size_c3",
+                                 "C3": "acquisition_sample_size_c3",
+                                 4: "acquisition_sample_size_c3",
+                                 "C4": "acquisition_sample_size_c3"}
+
     WRITE_INTERVAL_S = 0.02  # seconds
 
     ch_1 = Instrument.ChannelCreator(LeCroyT3DSO1204Channel, 1)
@@ -172,8 +215,54 @@ class LeCroyT3DSO1204(TeledyneOscilloscope):
     ch_4 = Instrument.ChannelCreator(LeCroyT3DSO1204Channel, 4)
 
     def __init__(self, adapter, name="LeCroy T3DSO1204 Oscilloscope", **kwargs):
+        self._preamble_cache = {}
+        self._preamble_cache_enabled = False
         super().__init__(adapter, name, **kwargs)
 
+    _CACHE_NEUTRAL_COMMANDS = ("WFSU", "ARM", "STOP", "TRMD")
+    """Commands that cannot change any field held in the preamble cache."""
+
+    def write(self, command, **kwargs):
+        """Write the command to the instrument through the adapter.
+
+        Any message that is not a pure query empties the waveform preamble cache,
+        since every driver setter goes through this method, see
+        :meth:`enable_preamble_cache`. Commands that cannot affect the cached
+        fields, like the waveform setup written on every download, are exempt.
+
+        :param command: command string to be sent to the instrument
+        """
+        if (self._preamble_cache_enabled and "?" not in command
+                and not command.startswith(self._CACHE_NEUTRAL_COMMANDS)):
+            self._preamble_cache.clear()
+        super().write(command, **kwargs)
+
+    def values(self, command, separator=',', cast=float, preprocess_reply=None, maxsplit=-1,
+               **kwargs):
+        """Write a command to the instrument and return a list of formatted values
+        from the result, with a fast path for purely numeric replies.
+
+        Replies that consist only of comma-separated numbers, like sample-size or
+        waveform queries, are tokenized at C level with ``numpy.fromstring``
+        instead of casting each element in Python. Mixed replies such as the one
+        of WFSU? are parsed element-wise like :meth:`CommonBase.values` does.
+
+        The parameters are the same as for :meth:`CommonBase.values`.
+        """
+        if (cast is float and preprocess_reply is None and self.preprocess_reply is None
+                and maxsplit == -1 and separator == ","):
+            results = self.ask(command, **kwargs).strip()
+            if _NUMERIC_CSV_RE.match(results):
+                return np.fromstring(results, sep=separator).tolist()
+            results = results.split(separator)
+            for i, result in enumerate(results):
+                try:
+                    results[i] = float(result)
+                except ValueError:
+                    pass  # Keep as string
+            return results
+        return super().values(command, separator, cast, preprocess_reply, maxsplit, **kwargs)
+
     ##################
     # Timebase Setup #
     ##################
@@ -210,11 +299,13 @@ class LeCroyT3DSO1204(TeledyneOscilloscope):
               (float)
 
         """
+        tdiv, trdl, hmag, hpos = self._query_many(
+            ["TDIV?", "TRDL?", "HMAG?", "HPOS?"], cacheable=("TDIV?", "TRDL?"))
         tb_setup = {
-            "timebase_scale": self.timebase_scale,
-            "timebase_offset": self.timebase_offset,
-            "timebase_hor_magnify": self.timebase_hor_magnify,
-            "timebase_hor_position": self.timebase_hor_position
+            "timebase_scale": float(tdiv),
+            "timebase_offset": float(trdl),
+            "timebase_hor_magnify": float(hmag),
+            "timebase_hor_position": float(hpos)
         }
         return tb_setup
 
@@ -248,8 +339,7 @@ class LeCroyT3DSO1204(TeledyneOscilloscope):
         Can be 'normal', 'peak', 'average', 'highres'.
         """,
         validator=strict_discrete_set,
-        values={"normal": "SAMPLING", "peak": "PEAK_DETECT", "average": "AVERAGE",
-                "highres": "HIGH_RES"},
+        values=_ACQUISITION_TYPES,
         map_values=True,
         get_process=lambda v: [v[0].lower(), int(v[1])] if len(v) == 2 and v[0] == "AVERAGE" else v
     )
@@ -263,8 +353,7 @@ class LeCroyT3DSO1204(TeledyneOscilloscope):
 
     acquisition_status = Instrument.measurement(
         "SAST?", """Get the acquisition status of the scope.""",
-        values={"stopped": "Stop", "triggered": "Trig'd", "ready": "Ready", "auto": "Auto",
-                "armed": "Arm"},
+        values=_ACQUISITION_STATES,
         map_values=True
     )
 
@@ -280,21 +369,20 @@ class LeCroyT3DSO1204(TeledyneOscilloscope):
         :param source: channel number of channel name.
         :return: acquisition sample size of that channel.
         """
-        if isinstance(source, str):
+        attr = self._ACQUISITION_SAMPLE_SIZES.get(source)
+        if attr is None and isinstance(source, str):
+            # Normalize spellings like "ch 2" or "channel 4" before giving up
             source = sanitize_source(source)
-        if source in [1, "C1"]:
-            return self.acquisition_sample_size_c1
-        elif source in [2, "C2"]:
-            return self.acquisition_sample_size_c2
-        elif source in [3, "C3"]:
-            return self.acquisition_sample_size_c3
-        elif source in [4, "C4"]:
-            return self.acquisition_sample_size_c4
+            attr = self._ACQUISITION_SAMPLE_SIZES.get(source)
+        if attr is not None:
+            return getattr(self, attr)
         elif source == "MATH":
             math_define = self.math_define[1]
-            match = re.match(r"'(\w+)[+\-/*](\w+)'", math_define)
-            return min(self.acquisition_sample_size(match.group(1)),
-                       self.acquisition_sample_size(match.group(2)))
+            match = _MATH_DEFINE_RE.match(math_define)
+            # Operands sharing an ADC resolve to the same property, query it once
+            attrs = dict.fromkeys(self._ACQUISITION_SAMPLE_SIZES[sanitize_source(group)]
+                                  for group in match.groups())
+            return min(getattr(self, attr) for attr in attrs)
         else:
             raise ValueError("Invalid source: must be 1, 2, 3, 4 or C1, C2, C3, C4, MATH.")
 
@@ -345,11 +433,113 @@ class LeCroyT3DSO1204(TeledyneOscilloscope):
         channels per A/D converter.
         """,
         validator=strict_discrete_set,
-        values={7e3: "7K", 7e4: "70K", 7e5: "700K", 7e6: "7M",
-                14e3: "14K", 14e4: "140K", 14e5: "1.4M", 14e6: "14M"},
+        values=_MEMORY_SIZES,
         map_values=True
     )
 
+    def enable_preamble_cache(self, enable=True):
+        """Enable or disable caching of the static waveform preamble fields.
+
+        Fields like the memory size, the timebase and the channel scale, offset and
+        unit rarely change between successive waveform downloads, yet every
+        :attr:`waveform_preamble` call re-queries them. With the cache enabled they
+        are queried once and reused, which reduces the SCPI traffic considerably
+        when acquiring many frames from the same setup.
+
+        Setting changes made through the driver empty the cache automatically,
+        since every non-query message passes through :meth:`write`.
+
+        .. warning::
+            The cache cannot detect changes made on the instrument front panel:
+            the user must call :meth:`invalidate_preamble_cache` after manually
+            reconfiguring the scope.
+
+        :param enable: True to enable the cache, False to disable it.
+        """
+        self._preamble_cache_enabled = enable
+        if not enable:
+            self._preamble_cache.clear()
+
+    def invalidate_preamble_cache(self):
+        """Empty the waveform preamble cache, see :meth:`enable_preamble_cache`."""
+        self._preamble_cache.clear()
+
+    def _cached(self, key, getter):
+        """Return the preamble cache entry for a key, calling the getter on a miss.
+
+        If the cache is disabled the getter is called unconditionally and nothing
+        is stored.
+
+        :param key: cache key.
+        :param getter: callable without arguments that fetches the value.
+        :return: the cached or freshly fetched value.
+        """
+        if not self._preamble_cache_enabled:
+            return getter()
+        if key not in self._preamble_cache:
+            self._preamble_cache[key] = getter()
+        return self._preamble_cache[key]
+
+    def _query_many(self, commands, cacheable=()):
+        """Batch several SCPI queries into a single compound query.
+
+        The commands are joined with ';' and sent as one message, so the whole batch
+        costs a single write/read round-trip (and a single WRITE_INTERVAL_S wait)
+        instead of one per command.
+
+        :param commands: list of SCPI query strings.
+        :param cacheable: subset of commands whose replies may be served from and
+            stored into the preamble cache, see :meth:`enable_preamble_cache`.
+        :return: list of reply strings, one per command, in the same order.
+        """
+        replies = {}
+        if self._preamble_cache_enabled:
+            replies = {cmd: self._preamble_cache[cmd] for cmd in commands
+                       if cmd in self._preamble_cache}
+        missing = [cmd for cmd in commands if cmd not in replies]
+        if missing:
+            fresh = self.ask(";".join(missing)).strip().split(";")
+            if len(fresh) != len(missing):
+                raise ValueError(f"Number of replies ({len(fresh)}) != "
+                                 f"number of queries ({len(missing)})")
+            fresh = dict(zip(missing, fresh))
+            if self._preamble_cache_enabled:
+                self._preamble_cache.update(
+                    (cmd, fresh[cmd]) for cmd in missing if cmd in cacheable)
+            replies.update(fresh)
+        return [replies[cmd] for cmd in commands]
+
+    @staticmethod
+    def _cast_values(reply, separator=","):
+        """Split a reply string and cast each element to float where possible,
+        like the :meth:`values` method does.
+
+        :param reply: reply string of a single query.
+        :param separator: separator character between the reply elements.
+        :return: list of the split elements, as float or string.
+        """
+        values = reply.split(separator)
+        for i, value in enumerate(values):
+            try:
+                values[i] = float(value)
+            except ValueError:
+                pass  # Keep as string
+        return values
+
+    @staticmethod
+    def _unmap(value, inverse_values):
+        """Map a raw instrument reply back to its user-facing value, like a
+        :meth:`Instrument.control` property with map_values=True does.
+
+        :param value: raw value received from the instrument.
+        :param inverse_values: inverse map of instrument values to user-facing values.
+        :return: the user-facing value.
+        """
+        try:
+            return inverse_values[value]
+        except KeyError:
+            raise KeyError(f"Value {value} not found in mapped values") from None
+
     @property
     def waveform_preamble(self):
         """Get preamble information for the selected waveform source as a dict with the
@@ -375,24 +565,39 @@ class LeCroyT3DSO1204(TeledyneOscilloscope):
         - "ydiv": vertical scale (units per division) in Volts
         - "yoffset": value that is represented at center of screen in Volts
         """
-        vals = self.values("WFSU?")
+        source = self.waveform_source
+        strict_discrete_set(source, ["C1", "C2", "C3", "C4", "MATH"])
+        commands = ["WFSU?", "ACQW?", "SARA?", "SAST?", "MSIZ?", "TDIV?", "TRDL?"]
+        if source != "MATH":
+            # Channels 1/2 and 3/4 share an ADC, so they share the sample size too
+            commands.append("SANU? C1" if source in ("C1", "C2") else "SANU? C3")
+        wfsu, acqw, sara, sast, msiz, tdiv, trdl, *sanu = self._query_many(
+            commands, cacheable=("MSIZ?", "TDIV?", "TRDL?"))
+        tokens = _results_list_to_dict(self._cast_values(wfsu))
+        acq_type = self._cast_values(acqw)
+        if len(acq_type) == 2 and acq_type[0] == "AVERAGE":
+            acq_type = [acq_type[0].lower(), int(acq_type[1])]
+        else:
+            acq_type = self._unmap(acq_type[0], self._ACQUISITION_TYPES_INV)
         preamble = {
-            "sparsing": vals[vals.index("SP") + 1],
-            "requested_points": vals[vals.index("NP") + 1],
-            "first_point": vals[vals.index("FP") + 1],
+            "sparsing": tokens["SP"],
+            "requested_points": tokens["NP"],
+            "first_point": tokens["FP"],
             "transmitted_points": None,
-            "source": self.waveform_source,
-            "type": self.acquisition_type,
-            "sampling_rate": self.acquisition_sampling_rate,
+            "source": source,
+            "type": acq_type,
+            "sampling_rate": float(sara),
             "grid_number": self._grid_number,
-            "status": self.acquisition_status,
-            "memory_size": self.memory_size,
-            "xdiv": self.timebase_scale,
-            "xoffset": self.timebase_offset
+            "status": self._unmap(sast, self._ACQUISITION_STATES_INV),
+            "memory_size": self._unmap(msiz, self._MEMORY_SIZES_INV),
+            "xdiv": float(tdiv),
+            "xoffset": float(trdl)
         }
         preamble["average"] = self.acquisition_average if preamble["type"][0] == "average" else None
-        strict_discrete_set(self.waveform_source, ["C1", "C2", "C3", "C4", "MATH"])
-        preamble["sampled_points"] = self.acquisition_sample_size(self.waveform_source)
+        if sanu:
+            preamble["sampled_points"] = float(sanu[0])
+        else:
+            preamble["sampled_points"] = self.acquisition_sample_size(source)
         return self._fill_yaxis_preamble(preamble)
 
     def _fill_yaxis_preamble(self, preamble=None):
@@ -403,15 +608,34 @@ class LeCroyT3DSO1204(TeledyneOscilloscope):
         if preamble is None:
             preamble = {}
         if self.waveform_source == "MATH":
-            preamble["ydiv"] = self.math_vdiv
-            preamble["yoffset"] = self.math_vpos
+            preamble["ydiv"] = self._cached("MTVD?", lambda: self.math_vdiv)
+            preamble["yoffset"] = self._cached("MTVP?", lambda: self.math_vpos)
             preamble["unit"] = None
         else:
-            preamble["ydiv"] = self.ch(self.waveform_source).scale
-            preamble["yoffset"] = self.ch(self.waveform_source).offset
-            preamble["unit"] = self.ch(self.waveform_source).unit
+            ch = self.ch(self.waveform_source)
+            commands = [ch.insert_id(cmd) for cmd in ("VDIV?", "OFST?", "UNIT?")]
+            vdiv, ofst, unit = self._query_many(commands, cacheable=commands)
+            preamble["ydiv"] = float(vdiv)
+            preamble["yoffset"] = float(ofst)
+            preamble["unit"] = unit
         return preamble
 
+    async def download_waveform_async(self, source, requested_points=None, sparsing=None):
+        """Get data points from the specified source without blocking the event loop.
+
+        This is an asyncio-compatible wrapper around :meth:`download_waveform`: the
+        blocking VISA transfer runs in the default executor, so a GUI or server
+        event loop stays responsive during long downloads. The driver talks through
+        a single VISA session, hence the preamble and data transfers are still
+        serialized with respect to each other; overlapping them would require a
+        second session to the scope.
+
+        Parameters and return value are the same as for :meth:`download_waveform`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(self.download_waveform, source, requested_points, sparsing))
+
     ###############
     #    Math     #
     ###############
@@ -26,7 +26,6 @@ from abc import ABCMeta
 import re
 import sys
 import time
-from decimal import Decimal
 import numpy as np
 
 from pymeasure.instruments import Instrument, Channel, SCPIUnknownMixin
@@ -859,23 +858,20 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
         starts from the left half of the screen.
 
         :return: tuple of (numpy array of Y points, numpy array of X points, waveform preamble) """
-
-        def _scale_data(y):
-            if preamble["source"] == "MATH":
-                value = int.from_bytes([y], byteorder='big', signed=False) * preamble["ydiv"] / 25.
-                value -= preamble["ydiv"] * (preamble["yoffset"] + 255) / 50.
-            else:
-                value = int.from_bytes([y], byteorder='big', signed=True) * preamble["ydiv"] / 25.
-                value -= preamble["yoffset"]
-            return value
-
-        def _scale_time(x):
-            return float(Decimal(-preamble["xdiv"] * self._grid_number / 2.) +
-                         Decimal(float(x * preamble["sparsing"])) /
-                         Decimal(preamble["sampling_rate"]))
-
-        data_points = np.vectorize(_scale_data)(ydata)
-        time_points = np.vectorize(_scale_time)(np.arange(len(data_points)))
+        # Scale and offset in place so that each axis needs a single allocation,
+        # which matters for multi-megapoint records.
+        if preamble["source"] == "MATH":
+            data_points = ydata.astype(np.float64)
+            data_points *= preamble["ydiv"] / 25.
+            data_points -= preamble["ydiv"] * (preamble["yoffset"] + 255) / 50.
+        else:
+            # The data points are transmitted as signed bytes
+            data_points = ydata.view(np.int8).astype(np.float64)
+            data_points *= preamble["ydiv"] / 25.
+            data_points -= preamble["yoffset"]
+        time_points = np.arange(len(data_points), dtype=np.float64)
+        time_points *= preamble["sparsing"] / preamble["sampling_rate"]
+        time_points -= preamble["xdiv"] * self._grid_number / 2.
         return data_points, time_points, preamble
 
     def download_waveform(self, source, requested_points=None, sparsing=None):
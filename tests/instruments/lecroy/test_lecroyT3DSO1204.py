@@ -22,6 +22,8 @@
 # THE SOFTWARE.
 #
 
+import asyncio
+
 import pytest
 
 from pymeasure.instruments.teledyne.teledyne_oscilloscope import sanitize_source
@@ -184,6 +186,21 @@ def test_memory_size():
         assert instr.memory_size == 7e3
 
 
+def test_timebase():
+    with expected_protocol(
+            LeCroyT3DSO1204,
+            [(b"CHDR OFF", None),
+             (b"TDIV?;TRDL?;HMAG?;HPOS?", b"5.00E-04;-0.00E+00;5.00E-06;0.00E+00"),
+             ]
+    ) as instr:
+        assert instr.timebase == {
+            "timebase_scale": 5e-4,
+            "timebase_offset": 0.0,
+            "timebase_hor_magnify": 5e-6,
+            "timebase_hor_position": 0.0,
+        }
+
+
 def test_sample_size():
     with expected_protocol(
             LeCroyT3DSO1204,
@@ -200,21 +217,29 @@ def test_sample_size():
         assert instr.acquisition_sample_size_c4 == 3.5e6
 
 
+def test_sample_size_math():
+    with expected_protocol(
+            LeCroyT3DSO1204,
+            [(b"CHDR OFF", None),
+             # Both operands share the same ADC, so SANU is queried only once
+             (b"DEF?", b"EQN,'C1+C2'"),
+             (b"SANU? C1", b"3.50E+06"),
+             (b"DEF?", b"EQN,'C2*C4'"),
+             (b"SANU? C1", b"3.50E+06"),
+             (b"SANU? C3", b"1.75E+06"),
+             ]
+    ) as instr:
+        assert instr.acquisition_sample_size("MATH") == 3.5e6
+        assert instr.acquisition_sample_size("MATH") == 1.75e6
+
+
 def test_waveform_preamble():
     with expected_protocol(
             LeCroyT3DSO1204,
             [(b"CHDR OFF", None),
-             (b"WFSU?", b"SP,1,NP,0,FP,0"),
-             (b"ACQW?", b"SAMPLING"),
-             (b"SARA?", b"1.00E+09"),
-             (b"SAST?", b"Trig'd"),
-             (b"MSIZ?", b"7M"),
-             (b"TDIV?", b"5.00E-04"),
-             (b"TRDL?", b"-0.00E+00"),
-             (b"SANU? C1", b"1.75E+06"),
-             (b"C1:VDIV?", b"5.00E-02"),
-             (b"C1:OFST?", b"-1.50E-01"),
-             (b"C1:UNIT?", b"V"),
+             (b"WFSU?;ACQW?;SARA?;SAST?;MSIZ?;TDIV?;TRDL?;SANU? C1",
+              b"SP,1,NP,0,FP,0;SAMPLING;1.00E+09;Trig'd;7M;5.00E-04;-0.00E+00;1.75E+06"),
+             (b"C1:VDIV?;C1:OFST?;C1:UNIT?", b"5.00E-02;-1.50E-01;V"),
              ]
     ) as instr:
         assert instr.waveform_preamble == {
@@ -238,10 +263,44 @@ def test_waveform_preamble():
         }
 
 
-def test_download_one_point():
+def test_waveform_preamble_cached():
     with expected_protocol(
             LeCroyT3DSO1204,
             [(b"CHDR OFF", None),
+             (b"WFSU?;ACQW?;SARA?;SAST?;MSIZ?;TDIV?;TRDL?;SANU? C1",
+              b"SP,1,NP,0,FP,0;SAMPLING;1.00E+09;Trig'd;7M;5.00E-04;-0.00E+00;1.75E+06"),
+             (b"C1:VDIV?;C1:OFST?;C1:UNIT?", b"5.00E-02;-1.50E-01;V"),
+             # The second read only queries the fields that are not cached
+             (b"WFSU?;ACQW?;SARA?;SAST?;SANU? C1",
+              b"SP,1,NP,0,FP,0;SAMPLING;1.00E+09;Trig'd;1.75E+06"),
+             # After invalidation all fields are queried again
+             (b"WFSU?;ACQW?;SARA?;SAST?;MSIZ?;TDIV?;TRDL?;SANU? C1",
+              b"SP,1,NP,0,FP,0;SAMPLING;1.00E+09;Trig'd;7M;5.00E-04;-0.00E+00;1.75E+06"),
+             (b"C1:VDIV?;C1:OFST?;C1:UNIT?", b"5.00E-02;-1.50E-01;V"),
+             # A setting change through the driver empties the cache as well
+             (b"MSIZ 14M", None),
+             (b"WFSU?;ACQW?;SARA?;SAST?;MSIZ?;TDIV?;TRDL?;SANU? C1",
+              b"SP,1,NP,0,FP,0;SAMPLING;1.00E+09;Trig'd;14M;5.00E-04;-0.00E+00;1.75E+06"),
+             (b"C1:VDIV?;C1:OFST?;C1:UNIT?", b"5.00E-02;-1.50E-01;V"),
+             ]
+    ) as instr:
+        instr.enable_preamble_cache()
+        first = instr.waveform_preamble
+        second = instr.waveform_preamble
+        assert second == first
+        instr.invalidate_preamble_cache()
+        third = instr.waveform_preamble
+        assert third == first
+        instr.memory_size = 14e6
+        fourth = instr.waveform_preamble
+        assert fourth["memory_size"] == 14e6
+
+
+def test_download_cached_preamble():
+    with expected_protocol(
+            LeCroyT3DSO1204,
+            [(b"CHDR OFF", None),
+             # First download queries the full preamble
              (b"WFSU SP,1", None),
              (b"WFSU NP,1", None),
              (b"WFSU FP,0", None),
@@ -249,17 +308,43 @@ def test_download_one_point():
              (b"WFSU NP,1", None),
              (b"WFSU FP,0", None),
              (b"C1:WF? DAT2", b"DAT2,#9000000001" + b"\x01" + b"\n\n"),
-             (b"WFSU?", b"SP,1,NP,2,FP,0"),
-             (b"ACQW?", b"SAMPLING"),
-             (b"SARA?", b"1.00E+09"),
-             (b"SAST?", b"Stop"),
-             (b"MSIZ?", b"7M"),
-             (b"TDIV?", b"5.00E-04"),
-             (b"TRDL?", b"-0.00E+00"),
+             (b"WFSU?;ACQW?;SARA?;SAST?;MSIZ?;TDIV?;TRDL?;SANU? C1",
+              b"SP,1,NP,2,FP,0;SAMPLING;1.00E+09;Stop;7M;5.00E-04;-0.00E+00;7.00E+06"),
+             (b"C1:VDIV?;C1:OFST?;C1:UNIT?", b"5.00E-02;-1.50E-01;V"),
+             # The WFSU writes of the second download do not empty the cache,
+             # so the static preamble fields are not queried again
+             (b"WFSU SP,1", None),
+             (b"WFSU NP,1", None),
+             (b"WFSU FP,0", None),
              (b"SANU? C1", b"7.00E+06"),
-             (b"C1:VDIV?", b"5.00E-02"),
-             (b"C1:OFST?", b"-1.50E-01"),
-             (b"C1:UNIT?", b"V")
+             (b"WFSU NP,1", None),
+             (b"WFSU FP,0", None),
+             (b"C1:WF? DAT2", b"DAT2,#9000000001" + b"\x01" + b"\n\n"),
+             (b"WFSU?;ACQW?;SARA?;SAST?;SANU? C1",
+              b"SP,1,NP,2,FP,0;SAMPLING;1.00E+09;Stop;7.00E+06"),
+             ],
+            connection_attributes={'chunk_size': 0},
+    ) as instr:
+        instr.enable_preamble_cache()
+        first = instr.download_waveform(source="c1", requested_points=1, sparsing=1)
+        second = instr.download_waveform(source="c1", requested_points=1, sparsing=1)
+        assert second[2] == first[2]
+
+
+def test_download_one_point():
+    with expected_protocol(
+            LeCroyT3DSO1204,
+            [(b"CHDR OFF", None),
+             (b"WFSU SP,1", None),
+             (b"WFSU NP,1", None),
+             (b"WFSU FP,0", None),
+             (b"SANU? C1", b"7.00E+06"),
+             (b"WFSU NP,1", None),
+             (b"WFSU FP,0", None),
+             (b"C1:WF? DAT2", b"DAT2,#9000000001" + b"\x01" + b"\n\n"),
+             (b"WFSU?;ACQW?;SARA?;SAST?;MSIZ?;TDIV?;TRDL?;SANU? C1",
+              b"SP,1,NP,2,FP,0;SAMPLING;1.00E+09;Stop;7M;5.00E-04;-0.00E+00;7.00E+06"),
+             (b"C1:VDIV?;C1:OFST?;C1:UNIT?", b"5.00E-02;-1.50E-01;V")
              ],
             connection_attributes={'chunk_size': 0},
     ) as instr:
@@ -299,17 +384,9 @@ def test_download_two_points():
              (b"WFSU NP,2", None),
              (b"WFSU FP,0", None),
              (b"C1:WF? DAT2", b"DAT2,#9000000002" + b"\x01\x01" + b"\n\n"),
-             (b"WFSU?", b"SP,1,NP,2,FP,0"),
-             (b"ACQW?", b"SAMPLING"),
-             (b"SARA?", b"1.00E+09"),
-             (b"SAST?", b"Stop"),
-             (b"MSIZ?", b"7M"),
-             (b"TDIV?", b"5.00E-04"),
-             (b"TRDL?", b"-0.00E+00"),
-             (b"SANU? C1", b"7.00E+06"),
-             (b"C1:VDIV?", b"5.00E-02"),
-             (b"C1:OFST?", b"-1.50E-01"),
-             (b"C1:UNIT?", b"V")
+             (b"WFSU?;ACQW?;SARA?;SAST?;MSIZ?;TDIV?;TRDL?;SANU? C1",
+              b"SP,1,NP,2,FP,0;SAMPLING;1.00E+09;Stop;7M;5.00E-04;-0.00E+00;7.00E+06"),
+             (b"C1:VDIV?;C1:OFST?;C1:UNIT?", b"5.00E-02;-1.50E-01;V")
              ],
             connection_attributes={'chunk_size': 0},
     ) as instr:
@@ -341,6 +418,30 @@ def test_download_two_points():
         assert y[1] == y[0]
 
 
+def test_download_waveform_async():
+    with expected_protocol(
+            LeCroyT3DSO1204,
+            [(b"CHDR OFF", None),
+             (b"WFSU SP,1", None),
+             (b"WFSU NP,1", None),
+             (b"WFSU FP,0", None),
+             (b"SANU? C1", b"7.00E+06"),
+             (b"WFSU NP,1", None),
+             (b"WFSU FP,0", None),
+             (b"C1:WF? DAT2", b"DAT2,#9000000001" + b"\x01" + b"\n\n"),
+             (b"WFSU?;ACQW?;SARA?;SAST?;MSIZ?;TDIV?;TRDL?;SANU? C1",
+              b"SP,1,NP,2,FP,0;SAMPLING;1.00E+09;Stop;7M;5.00E-04;-0.00E+00;7.00E+06"),
+             (b"C1:VDIV?;C1:OFST?;C1:UNIT?", b"5.00E-02;-1.50E-01;V")
+             ],
+            connection_attributes={'chunk_size': 0},
+    ) as instr:
+        y, x, preamble = asyncio.run(
+            instr.download_waveform_async(source="c1", requested_points=1, sparsing=1))
+        assert len(x) == 1
+        assert len(y) == 1
+        assert y[0] == 1 * 0.05 / 25. + 0.150
+
+
 def test_trigger():
     with expected_protocol(
             LeCroyT3DSO1204,
@@ -64,14 +64,24 @@ class TestLeCroyT3DSO1204:
     def instrument(self, connected_device_address):
         return LeCroyT3DSO1204(connected_device_address)
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def resetted_instrument(self, instrument):
+        """Reset the instrument once for all tests using this fixture.
+
+        The 7 s settling time after a reset made function-scoped fixtures the
+        dominant cost of the suite. Tests that change a setting must restore it
+        themselves instead of relying on a fresh reset.
+        """
         instrument.reset()
         sleep(7)
         return instrument
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def autoscaled_instrument(self, instrument):
+        """Reset and autoscale the instrument once for all tests using this fixture.
+
+        See :meth:`resetted_instrument` about restoring changed settings.
+        """
         instrument.reset()
         sleep(7)
         instrument.autoscale()
@@ -117,62 +127,106 @@ class TestLeCroyT3DSO1204:
     @pytest.mark.parametrize("ch_number", CHANNELS)
     @pytest.mark.parametrize("case", BOOLEANS)
     def test_ch_bwlimit(self, instrument, ch_number, case):
-        instrument.ch(ch_number).bwlimit = case
-        assert instrument.ch(ch_number).bwlimit == case
+        original = instrument.ch(ch_number).bwlimit
+        try:
+            instrument.ch(ch_number).bwlimit = case
+            assert instrument.ch(ch_number).bwlimit == case
+        finally:
+            instrument.ch(ch_number).bwlimit = original
 
     @pytest.mark.parametrize("ch_number", CHANNELS)
     @pytest.mark.parametrize("case", CHANNEL_COUPLINGS)
     def test_ch_coupling(self, instrument, ch_number, case):
-        instrument.ch(ch_number).coupling = case
-        assert instrument.ch(ch_number).coupling == case
+        original = instrument.ch(ch_number).coupling
+        try:
+            instrument.ch(ch_number).coupling = case
+            assert instrument.ch(ch_number).coupling == case
+        finally:
+            instrument.ch(ch_number).coupling = original
 
     @pytest.mark.parametrize("ch_number", CHANNELS)
     @pytest.mark.parametrize("case", BOOLEANS)
     def test_ch_display(self, instrument, ch_number, case):
-        instrument.ch(ch_number).display = case
-        assert instrument.ch(ch_number).display == case
+        original = instrument.ch(ch_number).display
+        try:
+            instrument.ch(ch_number).display = case
+            assert instrument.ch(ch_number).display == case
+        finally:
+            instrument.ch(ch_number).display = original
 
     @pytest.mark.parametrize("ch_number", CHANNELS)
     @pytest.mark.parametrize("case", BOOLEANS)
     def test_ch_invert(self, instrument, ch_number, case):
-        instrument.ch(ch_number).invert = case
-        assert instrument.ch(ch_number).invert == case
+        original = instrument.ch(ch_number).invert
+        try:
+            instrument.ch(ch_number).invert = case
+            assert instrument.ch(ch_number).invert == case
+        finally:
+            instrument.ch(ch_number).invert = original
 
     @pytest.mark.parametrize("ch_number", CHANNELS)
     def test_ch_offset(self, instrument, ch_number):
-        instrument.ch(ch_number).offset = 1
-        assert instrument.ch(ch_number).offset == 1
+        original = instrument.ch(ch_number).offset
+        try:
+            instrument.ch(ch_number).offset = 1
+            assert instrument.ch(ch_number).offset == 1
+        finally:
+            instrument.ch(ch_number).offset = original
 
     @pytest.mark.parametrize("ch_number", CHANNELS)
     def test_ch_probe_attenuation(self, instrument, ch_number):
-        instrument.ch(ch_number).probe_attenuation = 10
-        assert instrument.ch(ch_number).probe_attenuation == 10
+        original = instrument.ch(ch_number).probe_attenuation
+        try:
+            instrument.ch(ch_number).probe_attenuation = 10
+            assert instrument.ch(ch_number).probe_attenuation == 10
+        finally:
+            instrument.ch(ch_number).probe_attenuation = original
 
     @pytest.mark.parametrize("ch_number", CHANNELS)
     def test_ch_scale(self, instrument, ch_number):
-        instrument.ch(ch_number).scale = 1
-        assert instrument.ch(ch_number).scale == 1
+        original = instrument.ch(ch_number).scale
+        try:
+            instrument.ch(ch_number).scale = 1
+            assert instrument.ch(ch_number).scale == 1
+        finally:
+            instrument.ch(ch_number).scale = original
 
     def test_ch_trigger_level(self, autoscaled_instrument):
-        for case in self.TRIGGER_LEVELS:
-            autoscaled_instrument.ch_1.trigger_level = case
-            assert autoscaled_instrument.ch_1.trigger_level == case
+        original = autoscaled_instrument.ch_1.trigger_level
+        try:
+            for case in self.TRIGGER_LEVELS:
+                autoscaled_instrument.ch_1.trigger_level = case
+                assert autoscaled_instrument.ch_1.trigger_level == case
+        finally:
+            autoscaled_instrument.ch_1.trigger_level = original
 
     def test_ch_trigger_level2(self, autoscaled_instrument):
-        for case in self.TRIGGER_LEVELS:
-            autoscaled_instrument.ch_1.trigger_level2 = case
-            assert autoscaled_instrument.ch_1.trigger_level2 == case
+        original = autoscaled_instrument.ch_1.trigger_level2
+        try:
+            for case in self.TRIGGER_LEVELS:
+                autoscaled_instrument.ch_1.trigger_level2 = case
+                assert autoscaled_instrument.ch_1.trigger_level2 == case
+        finally:
+            autoscaled_instrument.ch_1.trigger_level2 = original
 
     def test_ch_trigger_slope(self, autoscaled_instrument):
         with pytest.raises(ValueError):
             autoscaled_instrument.ch_1.trigger_slope = "abcd"
+        original_select = autoscaled_instrument.trigger_select
+        original_slope = autoscaled_instrument.ch_1.trigger_slope
         autoscaled_instrument.trigger_select = ("edge", "c1", "off")
-        for case in self.TRIGGER_SLOPES:
-            autoscaled_instrument.ch_1.trigger_slope = case
-            assert autoscaled_instrument.ch_1.trigger_slope == case
+        try:
+            for case in self.TRIGGER_SLOPES:
+                autoscaled_instrument.ch_1.trigger_slope = case
+                assert autoscaled_instrument.ch_1.trigger_slope == case
+        finally:
+            autoscaled_instrument.ch_1.trigger_slope = original_slope
+            autoscaled_instrument.trigger_select = tuple(original_select)
 
     # Timebase
     def test_timebase(self, autoscaled_instrument):
+        original_magnify = autoscaled_instrument.timebase_hor_magnify
+        original_position = autoscaled_instrument.timebase_hor_position
         autoscaled_instrument.timebase_hor_magnify = 5e-6
         autoscaled_instrument.timebase_hor_position = 0
         expected = {
@@ -181,56 +235,101 @@ class TestLeCroyT3DSO1204:
             "timebase_hor_magnify": 5e-6,
             "timebase_hor_position": 0.0,
         }
-        actual = autoscaled_instrument.timebase
-        for key, val in actual.items():
-            assert pytest.approx(val, 0.1) == expected[key]
+        try:
+            actual = autoscaled_instrument.timebase
+            for key, val in actual.items():
+                assert pytest.approx(val, 0.1) == expected[key]
+        finally:
+            autoscaled_instrument.timebase_hor_magnify = original_magnify
+            autoscaled_instrument.timebase_hor_position = original_position
 
     def test_timebase_scale(self, resetted_instrument):
-        resetted_instrument.timebase_scale = 1e-3
-        assert resetted_instrument.timebase_scale == 1e-3
+        original = resetted_instrument.timebase_scale
+        try:
+            resetted_instrument.timebase_scale = 1e-3
+            assert resetted_instrument.timebase_scale == 1e-3
+        finally:
+            resetted_instrument.timebase_scale = original
 
     def test_timebase_offset(self, instrument):
-        instrument.timebase_offset = 1e-3
-        assert instrument.timebase_offset == 1e-3
+        original = instrument.timebase_offset
+        try:
+            instrument.timebase_offset = 1e-3
+            assert instrument.timebase_offset == 1e-3
+        finally:
+            instrument.timebase_offset = original
 
     def test_timebase_hor_magnify(self, instrument):
-        instrument.timebase_hor_magnify = 1e-4
-        assert instrument.timebase_hor_magnify == 1e-4
+        original = instrument.timebase_hor_magnify
+        try:
+            instrument.timebase_hor_magnify = 1e-4
+            assert instrument.timebase_hor_magnify == 1e-4
+        finally:
+            instrument.timebase_hor_magnify = original
 
     def test_timebase_hor_position(self, instrument):
-        instrument.timebase_hor_position = 5e-4
-        assert pytest.approx(instrument.timebase_hor_position, 0.1) == 5e-4
+        original = instrument.timebase_hor_position
+        try:
+            instrument.timebase_hor_position = 5e-4
+            assert pytest.approx(instrument.timebase_hor_position, 0.1) == 5e-4
+        finally:
+            instrument.timebase_hor_position = original
 
     # Acquisition
     @pytest.mark.parametrize("case", ACQUISITION_TYPES)
     def test_acquisition_type(self, resetted_instrument, case):
-        if case == "average":
-            resetted_instrument.acquisition_type = case
-            resetted_instrument.acquisition_average = 16
-            assert resetted_instrument.acquisition_type == ["average", 16]
-        else:
-            resetted_instrument.acquisition_type = case
-            assert resetted_instrument.acquisition_type == case
+        original = resetted_instrument.acquisition_type
+        if isinstance(original, list):
+            original = original[0]
+        try:
+            if case == "average":
+                resetted_instrument.acquisition_type = case
+                resetted_instrument.acquisition_average = 16
+                assert resetted_instrument.acquisition_type == ["average", 16]
+            else:
+                resetted_instrument.acquisition_type = case
+                assert resetted_instrument.acquisition_type == case
+        finally:
+            resetted_instrument.acquisition_type = original
 
     @pytest.mark.parametrize("case", ACQUISITION_AVERAGE)
     def test_acquisition_average(self, instrument, case):
-        instrument.acquisition_average = case
-        assert instrument.acquisition_average == case
+        original = instrument.acquisition_average
+        try:
+            instrument.acquisition_average = case
+            assert instrument.acquisition_average == case
+        finally:
+            instrument.acquisition_average = original
 
     def test_acquisition_status(self, autoscaled_instrument):
+        # Re-establish the autoscaled state: an intervening one-time reset from
+        # the class-scoped resetted_instrument fixture may have wiped it
+        autoscaled_instrument.autoscale()
+        sleep(7)
         assert autoscaled_instrument.acquisition_status == "triggered"
-        autoscaled_instrument.stop()
-        assert autoscaled_instrument.acquisition_status == "stopped"
+        try:
+            autoscaled_instrument.stop()
+            assert autoscaled_instrument.acquisition_status == "stopped"
+        finally:
+            autoscaled_instrument.run()
 
     def test_acquisition_sampling_rate(self, resetted_instrument):
         assert resetted_instrument.acquisition_sampling_rate == 1e9
 
     @pytest.mark.parametrize("case", WAVEFORM_POINTS)
     def test_waveform_points(self, instrument, case):
-        instrument.waveform_points = case
-        assert instrument.waveform_points == case
+        original = instrument.waveform_points
+        try:
+            instrument.waveform_points = case
+            assert instrument.waveform_points == case
+        finally:
+            instrument.waveform_points = original
 
     def test_waveform_preamble(self, autoscaled_instrument):
+        # Re-establish the autoscaled state: an intervening one-time reset from
+        # the class-scoped resetted_instrument fixture may have wiped it
+        autoscaled_instrument.autoscale()
+        sleep(7)
         autoscaled_instrument.acquisition_type = "normal"
         autoscaled_instrument.ch_1.offset = 0
         autoscaled_instrument.waveform_points = 0
@@ -484,6 +583,7 @@ class TestLeCroyT3DSO1204:
 
     # Trigger
     def test_trigger_select(self, resetted_instrument):
+        original = resetted_instrument.trigger_select
         with pytest.raises(ValueError):
             resetted_instrument.trigger_select = "edge"
         with pytest.raises(ValueError):
@@ -496,11 +596,14 @@ class TestLeCroyT3DSO1204:
             resetted_instrument.trigger_select = ("edge", "c1", "time", 1000)
         with pytest.raises(ValueError):
             resetted_instrument.trigger_select = ("edge", "c1", "time", 0, 1)
-        resetted_instrument.trigger_select = ("edge", "c1", "off")
-        resetted_instrument.trigger_select = ("EDGE", "C1", "OFF")
-        assert resetted_instrument.trigger_select == ["edge", "c1", "off"]
-        resetted_instrument.trigger_select = ("glit", "c1", "p2", 1e-3, 2e-3)
-        assert resetted_instrument.trigger_select == ["glit", "c1", "p2", 1e-3, 2e-3]
+        try:
+            resetted_instrument.trigger_select = ("edge", "c1", "off")
+            resetted_instrument.trigger_select = ("EDGE", "C1", "OFF")
+            assert resetted_instrument.trigger_select == ["edge", "c1", "off"]
+            resetted_instrument.trigger_select = ("glit", "c1", "p2", 1e-3, 2e-3)
+            assert resetted_instrument.trigger_select == ["glit", "c1", "p2", 1e-3, 2e-3]
+        finally:
+            resetted_instrument.trigger_select = tuple(original)
 
     def test_trigger_setup(self, resetted_instrument):
         expected = resetted_instrument.trigger